@@ -16,7 +16,8 @@ import requests
 from qlik_sense import services
 
 _logger = logging.getLogger(__name__)
-_logger.addHandler(logging.StreamHandler(sys.stdout))
+if not _logger.handlers:
+    _logger.addHandler(logging.StreamHandler(sys.stdout))
 _logger.setLevel(logging.DEBUG)
 
 
@@ -32,6 +33,7 @@ class Client(abc.ABC):
     _auth = None
     _cert = None
     _verify = False
+    _pool_maxsize = 16
 
     def __init__(self, host: str, port: int, scheme: str = 'https'):
         _logger.debug('__SET BASE URL')
@@ -39,11 +41,47 @@ class Client(abc.ABC):
         self._port = port
         self._scheme = scheme
 
+        _logger.debug('__SET SESSION')
+        self._session = self._get_session()
+
         _logger.debug('__SET SERVICES')
         self.app = services.AppService(self)
         self.stream = services.StreamService(self)
         self.user = services.UserService(self)
 
+    def _get_session(self) -> 'requests.Session':
+        """
+        Builds the session that all requests are sent through. The session is kept for the life of the client so that
+        connections to the server, along with their TLS handshakes and authentication, are pooled and reused across
+        calls.
+
+        Returns: a session with a connection pool mounted for the scheme
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize)
+        session.mount(f'{self._scheme}://', adapter)
+        return session
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """
+        The number of requests that can be sent through this client at the same time, bounded by its connection pool
+        """
+        return self._pool_maxsize
+
+    def close(self):
+        """
+        Closes the session, releasing the pooled connections to the server
+        """
+        _logger.debug('__CLOSE SESSION')
+        self._session.close()
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _get_headers(self, xrf_key: str) -> dict:
         """
         Builds the headers for the request
@@ -83,8 +121,7 @@ class Client(abc.ABC):
 
         Returns: the query string parameters as a dictionary
         """
-        if not params:
-            params = dict()
+        params = dict(params) if params else dict()
         params.update({'Xrfkey': xrf_key})
         return params
 
@@ -177,9 +214,9 @@ class Client(abc.ABC):
         """
         _logger.info(f'API REQUEST {method} <{url}> params={params} data={len(data) if data else None}')
         prepared_request = self._get_prepared_request(method=method, url=url, params=params, data=data)
-        session = requests.Session()
-        response = self._send_request(request=prepared_request, session=session)
+        response = self._send_request(request=prepared_request, session=self._session)
         if response.is_redirect:
-            response = self._handle_redirect(response=response, headers=prepared_request.headers, session=session)
+            response = self._handle_redirect(response=response, headers=prepared_request.headers,
+                                             session=self._session)
         _logger.info(f'API RESPONSE {response.text} headers={response.headers}')
         return response
@@ -7,7 +7,8 @@ from requests_negotiate_sspi import HttpNegotiateAuth
 from qlik_sense.clients import base
 
 _logger = logging.getLogger(__name__)
-_logger.addHandler(logging.StreamHandler(sys.stdout))
+if not _logger.handlers:
+    _logger.addHandler(logging.StreamHandler(sys.stdout))
 
 
 class NTLMClient(base.Client):
@@ -36,6 +37,14 @@ class NTLMClient(base.Client):
             _logger.debug('__SET NTLM SSPI AUTH')
             self._auth = HttpNegotiateAuth()
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """
+        The NTLM and SSPI auth objects keep the state of their handshake, so they can't be shared by concurrent
+        requests and requests through this client are sent one at a time
+        """
+        return 1
+
     def _get_headers(self, xrf_key: str) -> dict:
         """
         Gets the default headers that all requests need (including Xrfkey) and adds in headers that NTLM
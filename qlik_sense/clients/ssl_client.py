@@ -7,7 +7,8 @@ import urllib3
 from qlik_sense.clients import base
 
 _logger = logging.getLogger(__name__)
-_logger.addHandler(logging.StreamHandler(sys.stdout))
+if not _logger.handlers:
+    _logger.addHandler(logging.StreamHandler(sys.stdout))
 
 
 class SSLClient(base.Client):
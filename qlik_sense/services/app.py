@@ -2,8 +2,7 @@
 This module provides the mechanics for interacting with Qlik Sense apps. It uses a one-to-one model
 to wrap the QRS endpoints and uses marshmallow to parse the results into Qlik Sense App objects where appropriate.
 """
-from typing import TYPE_CHECKING, List, Optional, Iterable
-from dataclasses import asdict
+from typing import TYPE_CHECKING, List, Optional, Iterable, Union, Iterator
 
 from qlik_sense.models.app import AppCondensedSchema, AppSchema, AppExportSchema
 from .base import BaseService
@@ -13,7 +12,6 @@ if TYPE_CHECKING:
     from qlik_sense.clients.base import Client
     from qlik_sense.models.app import AppCondensed, App, AppExport
     from qlik_sense.models.stream import StreamCondensed
-    import requests
 
 
 class AppService(BaseService):
@@ -55,15 +53,10 @@ class AppService(BaseService):
         - qrs/app/{app.id}/replace/target: PUT
         - qrs/app/{app.id}/state: GET
     """
-    requests = list()
-
     def __init__(self, client: 'Client'):
         self.client = client
         self.url = '/qrs/app'
 
-    def _call(self, request: 'QSAPIRequest') -> 'requests.Response':
-        return self.client.call(**asdict(request))
-
     def query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
               full_attribution: bool = False) -> 'Optional[List[AppCondensed]]':
         """
@@ -86,6 +79,28 @@ class AppService(BaseService):
         return self._query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
                            full_attribution=full_attribution)
 
+    def iter_query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
+                   full_attribution: bool = False) -> 'Optional[Iterator[Union[AppCondensed, App]]]':
+        """
+        This method queries Qlik Sense apps like query(), but yields the apps one at a time instead of returning
+        them all in a list
+
+        Args:
+            filter_by: a filter string in jquery format
+            order_by: an order by string
+            privileges:
+            full_attribution: allows the response to contain the full app attribution,
+                defaults to False (limited attribution)
+
+        Returns: an iterator over the Qlik Sense Apps that meet the query_string criteria (or None)
+        """
+        if full_attribution:
+            schema = AppSchema()
+        else:
+            schema = AppCondensedSchema()
+        return self._iter_query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
+                                full_attribution=full_attribution)
+
     def get_by_name_and_stream(self, app_name: str, stream_name: str) -> 'Optional[List[AppCondensed]]':
         """
         This method is such a common use case of the query() method that it gets its own method
@@ -135,6 +150,15 @@ class AppService(BaseService):
         """
         self._delete(entity=app)
 
+    def delete_many(self, apps: 'List[AppCondensed]'):
+        """
+        This method deletes the provided apps from the server
+
+        Args:
+            apps: a list of apps to delete
+        """
+        self._delete_many(entities=apps)
+
     def copy(self, app: 'AppCondensed', name: str = None, include_custom_properties: bool = False) -> 'Optional[App]':
         """
         This method copies the provided app
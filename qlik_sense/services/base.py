@@ -3,10 +3,10 @@ This module provides a mixin with the base mechanics for interacting with Qlik S
 """
 import logging
 import sys
-from typing import TYPE_CHECKING, List, Optional, Union
-from dataclasses import asdict
+from typing import TYPE_CHECKING, List, Optional, Union, Iterator
 import abc
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from qlik_sense.models.base import EntityCondensedSchema, EntitySchema
 from .util import QSAPIRequest
@@ -16,7 +16,8 @@ if TYPE_CHECKING:
     import requests
 
 _logger = logging.getLogger(__name__)
-_logger.addHandler(logging.StreamHandler(sys.stdout))
+if not _logger.handlers:
+    _logger.addHandler(logging.StreamHandler(sys.stdout))
 _logger.setLevel(logging.DEBUG)
 
 
@@ -37,7 +38,7 @@ class BaseService(abc.ABC):
     client = None
 
     def _call(self, request: 'QSAPIRequest') -> 'requests.Response':
-        return self.client.call(**asdict(request))
+        return self.client.call(method=request.method, url=request.url, params=request.params, data=request.data)
 
     def _query(self, schema: 'Union[EntityCondensedSchema, EntitySchema]',
                filter_by: str, order_by: str, privileges: 'Optional[List[str]]',
@@ -55,6 +56,50 @@ class BaseService(abc.ABC):
 
         Returns: a list of Qlik Sense Entities that meet the query_string criteria (or None)
         """
+        request = self._get_query_request(filter_by=filter_by, order_by=order_by, privileges=privileges,
+                                          full_attribution=full_attribution)
+        response = self._call(request)
+        if 200 <= response.status_code < 300:
+            return schema.loads(response.content, many=True)
+        return None
+
+    def _iter_query(self, schema: 'Union[EntityCondensedSchema, EntitySchema]',
+                    filter_by: str, order_by: str, privileges: 'Optional[List[str]]',
+                    full_attribution: bool) -> 'Optional[Iterator[Union[EntityCondensed, Entity]]]':
+        """
+        This method queries Qlik Sense entities like _query(), but returns an iterator that builds each entity object
+        only when it's needed, rather than building the whole list up front. The request is sent right away, so a
+        failed query returns None, just like _query().
+
+        Args:
+            schema: schema representing the object to return
+            filter_by: a filter string in jquery format
+            order_by: an order by string
+            privileges:
+            full_attribution: allows the response to contain either the full entity attribution, or a condensed version
+
+        Returns: an iterator over the Qlik Sense Entities that meet the query_string criteria (or None)
+        """
+        request = self._get_query_request(filter_by=filter_by, order_by=order_by, privileges=privileges,
+                                          full_attribution=full_attribution)
+        response = self._call(request)
+        if 200 <= response.status_code < 300:
+            return (schema.load(entity) for entity in response.json())
+        return None
+
+    def _get_query_request(self, filter_by: str, order_by: str, privileges: 'Optional[List[str]]',
+                           full_attribution: bool) -> 'QSAPIRequest':
+        """
+        Builds the request for a query, shared by _query() and _iter_query()
+
+        Args:
+            filter_by: a filter string in jquery format
+            order_by: an order by string
+            privileges:
+            full_attribution: queries the full entity attribution endpoint when True
+
+        Returns: the query request
+        """
         if full_attribution:
             url = f'{self.url}/full'
         else:
@@ -64,11 +109,7 @@ class BaseService(abc.ABC):
             'orderby': order_by,
             'privileges': privileges
         }
-        request = QSAPIRequest(method='GET', url=url, params=params)
-        response = self._call(request)
-        if 200 <= response.status_code < 300:
-            return schema.loads(response.content, many=True)
-        return None
+        return QSAPIRequest(method='GET', url=url, params=params)
 
     def query_count(self, filter_by: str = None) -> 'Optional[int]':
         """
@@ -211,3 +252,15 @@ class BaseService(abc.ABC):
             url=f'{self.url}/{entity.id}'
         )
         self._call(request)
+
+    def _delete_many(self, entities: 'List[EntityCondensed]'):
+        """
+        This method deletes the provided entities from the server. QRS does not provide a bulk delete endpoint, so the
+        individual deletes are sent concurrently, with no more threads than the client's max_concurrent_requests (one
+        at a time for clients whose auth can't be shared across threads, such as NTLM and SSPI).
+
+        Args:
+            entities: a list of entities to delete
+        """
+        with ThreadPoolExecutor(max_workers=self.client.max_concurrent_requests) as executor:
+            list(executor.map(lambda entity: self._delete(entity=entity), entities))
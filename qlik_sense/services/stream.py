@@ -2,8 +2,7 @@
 This module provides the mechanics for interacting with Qlik Sense streams. It uses a one-to-one model
 to wrap the QRS endpoints and uses marshmallow to parse the results into Qlik Sense Stream objects where appropriate.
 """
-from typing import TYPE_CHECKING, List, Optional, Union
-from dataclasses import asdict
+from typing import TYPE_CHECKING, List, Optional, Union, Iterator
 
 from qlik_sense.models.stream import StreamCondensedSchema, StreamSchema
 from .base import BaseService
@@ -11,8 +10,6 @@ from .base import BaseService
 if TYPE_CHECKING:
     from qlik_sense.clients.base import Client
     from qlik_sense.models.stream import StreamCondensed, Stream
-    from .util import QSAPIRequest
-    import requests
 
 
 class StreamService(BaseService):
@@ -37,15 +34,10 @@ class StreamService(BaseService):
         - qrs/stream/previewprivileges: POST
         - qrs/stream/table: POST
     """
-    requests = list()
-
     def __init__(self, client: 'Client'):
         self.client = client
         self.url = '/qrs/stream'
 
-    def _call(self, request: 'QSAPIRequest') -> 'requests.Response':
-        return self.client.call(**asdict(request))
-
     def query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
               full_attribution: bool = False) -> 'Optional[List[StreamCondensed]]':
         """
@@ -68,6 +60,28 @@ class StreamService(BaseService):
         return self._query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
                            full_attribution=full_attribution)
 
+    def iter_query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
+                   full_attribution: bool = False) -> 'Optional[Iterator[Union[StreamCondensed, Stream]]]':
+        """
+        This method queries Qlik Sense streams like query(), but yields the streams one at a time instead of returning
+        them all in a list
+
+        Args:
+            filter_by: a filter string in jquery format
+            order_by: an order by string
+            privileges:
+            full_attribution: allows the response to contain the full stream attribution,
+                defaults to False (limited attribution)
+
+        Returns: an iterator over the Qlik Sense Streams that meet the query_string criteria (or None)
+        """
+        if full_attribution:
+            schema = StreamSchema()
+        else:
+            schema = StreamCondensedSchema()
+        return self._iter_query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
+                                full_attribution=full_attribution)
+
     def get_by_name(self, name: str, full_attribution: bool = False) -> 'Optional[Union[StreamCondensed, Stream]]':
         """
         This method is such a common use case of the query() method that it gets its own method
@@ -164,3 +178,12 @@ class StreamService(BaseService):
             stream: stream to delete
         """
         self._delete(entity=stream)
+
+    def delete_many(self, streams: 'List[StreamCondensed]'):
+        """
+        This method deletes the provided streams from the server
+
+        Args:
+            streams: a list of streams to delete
+        """
+        self._delete_many(entities=streams)
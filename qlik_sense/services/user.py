@@ -2,8 +2,7 @@
 This module provides the mechanics for interacting with Qlik Sense users. It uses a one-to-one model
 to wrap the QRS endpoints and uses marshmallow to parse the results into Qlik Sense Stream objects where appropriate.
 """
-from typing import TYPE_CHECKING, List, Optional, Union
-from dataclasses import asdict
+from typing import TYPE_CHECKING, List, Optional, Union, Iterator
 
 from qlik_sense.models.user import UserCondensedSchema, UserSchema
 from .base import BaseService
@@ -11,8 +10,6 @@ from .base import BaseService
 if TYPE_CHECKING:
     from qlik_sense.clients.base import Client
     from qlik_sense.models.user import UserCondensed, User
-    from .util import QSAPIRequest
-    import requests
 
 
 class UserService(BaseService):
@@ -39,15 +36,10 @@ class UserService(BaseService):
         - qrs/user/previewprivileges: POST
         - qrs/user/table: POST
     """
-    requests = list()
-
     def __init__(self, client: 'Client'):
         self.client = client
         self.url = '/qrs/user'
 
-    def _call(self, request: 'QSAPIRequest') -> 'requests.Response':
-        return self.client.call(**asdict(request))
-
     def query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
               full_attribution: bool = False) -> 'Optional[List[Union[UserCondensed, User]]]':
         """
@@ -70,6 +62,28 @@ class UserService(BaseService):
         return self._query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
                            full_attribution=full_attribution)
 
+    def iter_query(self, filter_by: str = None, order_by: str = None, privileges: 'Optional[List[str]]' = None,
+                   full_attribution: bool = False) -> 'Optional[Iterator[Union[UserCondensed, User]]]':
+        """
+        This method queries Qlik Sense users like query(), but yields the users one at a time instead of returning
+        them all in a list
+
+        Args:
+            filter_by: a filter string in jquery format
+            order_by: an order by string
+            privileges:
+            full_attribution: allows the response to contain the full user attribution,
+                defaults to False (limited attribution)
+
+        Returns: an iterator over the Qlik Sense Users that meet the query_string criteria (or None)
+        """
+        if full_attribution:
+            schema = UserSchema()
+        else:
+            schema = UserCondensedSchema()
+        return self._iter_query(schema=schema, filter_by=filter_by, order_by=order_by, privileges=privileges,
+                                full_attribution=full_attribution)
+
     def get_by_name_and_directory(self, user_name: str, directory: str,
                                   full_attribution: bool = False) -> 'Optional[Union[UserCondensed, User]]':
         """
@@ -167,3 +181,12 @@ class UserService(BaseService):
             user: user to delete
         """
         self._delete(entity=user)
+
+    def delete_many(self, users: 'List[UserCondensed]'):
+        """
+        This method deletes the provided users from the server
+
+        Args:
+            users: a list of users to delete
+        """
+        self._delete_many(entities=users)
@@ -2,9 +2,35 @@ from dataclasses import dataclass
 from typing import Union, Optional
 
 
-@dataclass
+def _freeze(value):
+    """
+    Converts a request attribute, including nested dicts and lists, into a hashable equivalent
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(val) for val in value)
+    return value
+
+
+@dataclass(frozen=True)
 class QSAPIRequest:
     method: str
     url: str
     params: dict = None
     data: Optional[Union[str, list, dict]] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, '_hash', hash((self.method, self.url, _freeze(self.params), _freeze(self.data))))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self._hash != other._hash:
+            return False
+        return (self.method, self.url, self.params, self.data) == (other.method, other.url, other.params, other.data)
@@ -10,3 +10,10 @@ from qlik_sense import services, SSLClient, NTLMClient
 from qlik_sense.models import app, stream, user
 from qlik_sense.services import util
 from qlik_sense.clients.base import Client
+
+
+def pytest_sessionstart(session):
+    # sweep up what crashed end to end runs left on the live server, once and before any pytest-xdist worker starts
+    from tests.test_e2e import auth, config
+    if auth.HOST and not hasattr(session.config, 'workerinput'):
+        config.delete_orphaned_test_entities()
@@ -1,8 +1,75 @@
-from typing import Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union, Iterator
+from collections import deque
+import itertools
+import json
+import uuid
 
-import requests
+from .conftest import services, app, stream, user, Client
 
-from .conftest import services, app, stream, user, util, Client
+if TYPE_CHECKING:
+    from .conftest import util
+    import requests
+
+_export_tokens = itertools.count(1)
+
+
+class FakeResponse:
+    """
+    This is a stand-in for requests.Response that carries only the attributes the services read from a response. It
+    keeps the fakes from having to build a real Response object for every logged request.
+    """
+    __slots__ = ('status_code', 'content')
+
+    def __init__(self, status_code: int = 100, content: bytes = b''):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> 'Iterator[bytes]':
+        return (self.content[i:i + chunk_size] for i in range(0, len(self.content), chunk_size))
+
+
+empty_response = FakeResponse()
+
+
+class FakeRequestLog:
+    """
+    This is the log of requests made through a fake service. Requests are kept in the order they were made, and are
+    also held in a set and indexed by endpoint so that the lookups in the unit tests don't scan the whole log.
+    """
+    __slots__ = ('_requests', '_request_set', '_requests_by_endpoint')
+
+    def __init__(self):
+        self._requests = deque()
+        self._request_set = set()
+        self._requests_by_endpoint = dict()
+
+    def __contains__(self, request: 'util.QSAPIRequest') -> bool:
+        return request in self._request_set
+
+    def __iter__(self) -> 'Iterator[util.QSAPIRequest]':
+        return iter(self._requests)
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def __repr__(self) -> str:
+        return repr(self._requests)
+
+    def append(self, request: 'util.QSAPIRequest'):
+        self._requests.append(request)
+        self._request_set.add(request)
+        self._requests_by_endpoint.setdefault((request.method, request.url), []).append(request)
+
+    def clear(self):
+        self._requests.clear()
+        self._request_set.clear()
+        self._requests_by_endpoint.clear()
+
+    def get_requests(self, method: str, url: str) -> 'List[util.QSAPIRequest]':
+        return self._requests_by_endpoint.get((method, url), [])
 
 
 class FakeClient(Client):
@@ -10,12 +77,41 @@ class FakeClient(Client):
     def __init__(self):
         super().__init__(scheme='https', host='localhost', port=80)
 
+    def _get_session(self) -> None:
+        return None
+
     def call(self, method: str, url: str, params: 'Optional[dict]' = None,
              data: 'Optional[Union[str, list, dict]]' = None) -> 'requests.Response':
         pass
 
 
-class FakeAppService(services.AppService):
+class FakeServiceMixin:
+    """
+    This mixin provides the request logging shared by the fake services. Each request is logged in the instance so
+    that it can be inspected by the unit tests. Canned responses are registered once per endpoint, and optionally per
+    filter, with add_fake_response(), every other request gets an empty response.
+    """
+    requests = None
+    _responses = None
+
+    def _call(self, request: 'util.QSAPIRequest') -> 'FakeResponse':
+        self.requests.append(request)
+        return self._get_fake_response(request)
+
+    def _get_fake_response(self, request: 'util.QSAPIRequest') -> 'FakeResponse':
+        filter_by = request.params.get('filter') if request.params else None
+        return self._responses.get((request.method, request.url, filter_by), empty_response)
+
+    def add_fake_response(self, method: str, url: str, response: 'FakeResponse', filter_by: str = None):
+        self._responses[(method, url, filter_by)] = response
+
+    def add_fake_query_response(self, filter_by: str, entities: 'List[dict]', full_attribution: bool = False):
+        self.add_fake_response(method='GET', url=f'{self.url}/full' if full_attribution else self.url,
+                               filter_by=filter_by,
+                               response=FakeResponse(status_code=200, content=json.dumps(entities).encode()))
+
+
+class FakeAppService(FakeServiceMixin, services.AppService):
     """
     This is a fake service that mocks out the actual API wrapper calls to the Qlik Sense Client class. All app service
     API calls are routed through this class. Hence, this replaces external calls from the system. Each request is
@@ -23,29 +119,35 @@ class FakeAppService(services.AppService):
     """
     def __init__(self):
         super().__init__(client=FakeClient())
-        self.requests = []
-        self._apps = list()
+        self.requests = FakeRequestLog()
+        self._apps = dict()
+        self._responses = dict()
         self.client.app = self
 
-    def _call(self, request: 'util.QSAPIRequest') -> 'requests.Response':
-        self.requests.append(request)
-        response = requests.Response()
-        response.status_code = 100
-        return response
+    def _get_fake_response(self, request: 'util.QSAPIRequest') -> 'FakeResponse':
+        if request.method == 'GET' and request.url.endswith('/export'):
+            return FakeResponse(status_code=200, content=json.dumps({'value': self._get_fake_export_token()}).encode())
+        return super()._get_fake_response(request)
+
+    @staticmethod
+    def _get_fake_export_token() -> str:
+        return str(uuid.UUID(int=next(_export_tokens)))
 
     def get_fake_app(self, id: str) -> 'Optional[app.AppCondensed]':
-        return next((a for a in self._apps if a.id == id), None)
+        return self._apps.get(id)
+
+    def add_fake_app(self, fake_app: 'app.AppCondensed'):
+        self.add_fake_apps([fake_app])
 
-    def add_fake_app(self, app_id: str, app_name: str, stream_id: str = None, stream_name: str = None):
-        if stream_id:
-            new_stream = stream.StreamCondensed(id=stream_id, name=stream_name)
-            new_app = app.AppCondensed(id=app_id, name=app_name, stream=new_stream)
-        else:
-            new_app = app.AppCondensed(id=app_id, name=app_name)
-        self._apps.append(new_app)
+    def add_fake_apps(self, fake_apps: 'List[app.AppCondensed]'):
+        self._apps.update({a.id: a for a in fake_apps})
 
+    def add_fake_download(self, download_path: str, content: bytes):
+        self.add_fake_response(method='GET', url=f'{self.url}/{download_path}',
+                               response=FakeResponse(status_code=200, content=content))
 
-class FakeStreamService(services.StreamService):
+
+class FakeStreamService(FakeServiceMixin, services.StreamService):
     """
     This is a fake service that mocks out the actual API wrapper calls to the Qlik Sense Client class. All stream service
     API calls are routed through this class. Hence, this replaces external calls from the system. Each request is
@@ -53,25 +155,20 @@ class FakeStreamService(services.StreamService):
     """
     def __init__(self):
         super().__init__(client=FakeClient())
-        self.requests = []
-        self._streams = list()
+        self.requests = FakeRequestLog()
+        self._responses = dict()
+        self._streams = dict()
         self.client.stream = self
 
-    def _call(self, request: 'util.QSAPIRequest') -> 'requests.Response':
-        self.requests.append(request)
-        response = requests.Response()
-        response.status_code = 100
-        return response
-
     def get_fake_stream(self, id: str) -> 'Optional[stream.StreamCondensed]':
-        return next((s for s in self._streams if s.id == id), None)
+        return self._streams.get(id)
 
     def add_fake_stream(self, id: str = None, name: str = None):
         new_stream = stream.StreamCondensed(id=id, name=name)
-        self._streams.append(new_stream)
+        self._streams[new_stream.id] = new_stream
 
 
-class FakeUserService(services.UserService):
+class FakeUserService(FakeServiceMixin, services.UserService):
     """
     This is a fake service that mocks out the actual API wrapper calls to the Qlik Sense Client class. All user service
     API calls are routed through this class. Hence, this replaces external calls from the system. Each request is
@@ -79,19 +176,14 @@ class FakeUserService(services.UserService):
     """
     def __init__(self):
         super().__init__(client=FakeClient())
-        self.requests = []
-        self._users = list()
+        self.requests = FakeRequestLog()
+        self._responses = dict()
+        self._users = dict()
         self.client.user = self
 
-    def _call(self, request: 'util.QSAPIRequest') -> 'requests.Response':
-        self.requests.append(request)
-        response = requests.Response()
-        response.status_code = 100
-        return response
-
     def get_fake_user(self, id: str) -> 'Optional[user.UserCondensed]':
-        return next((u for u in self._users if u.id == id), None)
+        return self._users.get(id)
 
     def add_fake_user(self, id: str = None, name: str = None):
         new_user = user.UserCondensed(id=id, name=name)
-        self._users.append(new_user)
+        self._users[new_user.id] = new_user
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
-import json
-from dataclasses import asdict
+import io
+import re
+
+import pytest
 
 from .conftest import app, stream, util
 from .fakes import FakeAppService
@@ -8,161 +10,161 @@ from .fakes import FakeAppService
 if TYPE_CHECKING:
     from .conftest import Client
 
-fake_apps = [
-    {'app_id': 'app_1', 'app_name': 'My App', 'stream_id': 'stream_1', 'stream_name': 'My Stream'},
-    {'app_id': 'app_2', 'app_name': 'Not My App', 'stream_id': 'stream_1', 'stream_name': 'My Stream'},
-    {'app_id': 'app_3', 'app_name': 'My Other App'}
+my_stream = stream.StreamCondensed(id='stream_1', name='My Stream')
+app_1 = app.AppCondensed(id='app_1', name='My App', stream=my_stream)
+app_2 = app.AppCondensed(id='app_2', name='Not My App', stream=my_stream)
+app_3 = app.AppCondensed(id='app_3', name='My Other App')
+fake_apps = [app_1, app_2, app_3]
+
+app_export = app.AppExport(schema_path='',
+                           export_token='export_1',
+                           app_id='app_1',
+                           download_path='path/to/my/download',
+                           is_cancelled=False)
+app_export_content = b'qvf'
+my_stream_json = {'id': 'a3b4c2d1-0c7e-4a53-9f0e-1d2c3b4a5f60', 'name': 'My Stream'}
+app_1_json = {'id': 'b1e2d3c4-5f60-4a7b-8c9d-0e1f2a3b4c5d', 'name': 'My App', 'stream': my_stream_json}
+app_2_json = {'id': 'c2f3e4d5-6a71-4b8c-9d0e-1f2a3b4c5d6e', 'name': 'Not My App', 'stream': my_stream_json}
+my_user_json = {'id': 'd3a4f5e6-7b82-4c9d-8e1f-2a3b4c5d6e7f', 'name': 'My User', 'userId': 'me',
+                'userDirectory': 'MY_DIRECTORY', 'userDirectoryConnectorName': 'MY_DIRECTORY'}
+my_apps_full_json = [
+    dict(app_1_json, owner=my_user_json, published=True, createdDate='2019-12-01T10:30:00.000Z'),
+    dict(app_2_json, owner=my_user_json, published=False, fileSize=1024),
+]
+export_url = re.compile(r'/qrs/app/(?P<app_id>[^/]+)/export/(?P<export_token>[^/]+)')
+
+app_requests = [
+    ('query', {'filter_by': 'find my app'}, util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app',
+        params={'filter': 'find my app', 'orderby': None, 'privileges': None}
+    )),
+    ('query_count', {'filter_by': 'find my app'}, util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app/count',
+        params={'filter': 'find my app'}
+    )),
+    ('get_by_name_and_stream', {'app_name': 'My App', 'stream_name': 'My Stream'}, util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app',
+        params={'filter': "name eq 'My App' and stream.name eq 'My Stream'", 'orderby': None, 'privileges': None}
+    )),
+    ('get', {'id': 'app_2'}, util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app/app_2',
+        params={'privileges': None}
+    )),
+    ('update', {'app': app_1}, util.QSAPIRequest(
+        method='PUT',
+        url='/qrs/app/app_1',
+        params={'privileges': None},
+        data=app.AppSchema().dumps(app_1)
+    )),
+    ('delete', {'app': app_1}, util.QSAPIRequest(
+        method='DELETE',
+        url='/qrs/app/app_1'
+    )),
+    ('copy', {'app': app_1, 'name': app_1.name}, util.QSAPIRequest(
+        method='POST',
+        url='/qrs/app/app_1/copy',
+        params={'name': app_1.name, 'includecustomproperties': False}
+    )),
+    ('replace', {'app': app_1, 'app_to_replace': app_2}, util.QSAPIRequest(
+        method='PUT',
+        url='/qrs/app/app_1/replace',
+        params={'app': app_2.id}
+    )),
+    ('reload', {'app': app_1}, util.QSAPIRequest(
+        method='POST',
+        url='/qrs/app/app_1/reload'
+    )),
+    ('publish', {'app': app_1, 'stream': my_stream}, util.QSAPIRequest(
+        method='PUT',
+        url='/qrs/app/app_1/publish',
+        params={'stream': my_stream.id, 'name': app_1.name}
+    )),
+    ('unpublish', {'app': app_1}, util.QSAPIRequest(
+        method='POST',
+        url='/qrs/app/app_1/unpublish'
+    )),
+    ('get_export_token', {'app': app_1}, util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app/app_1/export'
+    )),
+    ('delete_export', {'app_export': app_export}, util.QSAPIRequest(
+        method='DELETE',
+        url='/qrs/app/app_1/export/export_1'
+    )),
+    ('download_file', {'app_export': app_export}, util.QSAPIRequest(
+        method='GET',
+        url=f'/qrs/app/{app_export.download_path}'
+    )),
 ]
 
 
-def client_factory() -> 'Client':
+@pytest.fixture(scope='module')
+def client_template() -> 'Client':
     app_service = FakeAppService()
-    for app in fake_apps:
-        app_service.add_fake_app(**app)
+    app_service.add_fake_apps(fake_apps)
+    app_service.add_fake_download(download_path=app_export.download_path, content=app_export_content)
+    for app_name, stream_name, app_json in [('My App', 'My Stream', app_1_json),
+                                            ('Not My App', 'My Stream', app_2_json),
+                                            ('My App', 'Not My Stream', None)]:
+        app_service.add_fake_query_response(filter_by=f"name eq '{app_name}' and stream.name eq '{stream_name}'",
+                                            entities=[app_json] if app_json else [])
+    app_service.add_fake_query_response(filter_by="owner.userId eq 'me'", entities=my_apps_full_json,
+                                        full_attribution=True)
     return app_service.client
 
 
-class TestApp:
-
-    def setup_method(self):
-        self.client = client_factory()
-
-    def test_query(self):
-        query_string = 'find my app'
-        self.client.app.query(filter_by=query_string)
-        request = util.QSAPIRequest(
-            method='GET',
-            url=f'/qrs/app',
-            params={
-                'filter': query_string,
-                'orderby': None,
-                'privileges': None
-            },
-            data=None
-        )
-        assert request in self.client.app.requests
-
-    def test_query_count(self):
-        pass
-
-    def test_get_by_name_and_stream(self):
-        self.client.app.get_by_name_and_stream(app_name='My App', stream_name='My Stream')
-        request = util.QSAPIRequest(
-            method='GET',
-            url=f'/qrs/app',
-            params={
-                'filter': "name eq 'My App' and stream.name eq 'My Stream'",
-                'orderby': None,
-                'privileges': None
-            }
-        )
-        assert request in self.client.app.requests
-
-    def test_get(self):
-        self.client.app.get(id='app_2')
-        request = util.QSAPIRequest(
-            method='GET',
-            url=f'/qrs/app/app_2',
-            params={'privileges': None},
-            data=None
-        )
-        assert request in self.client.app.requests
-
-    def test_update(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        self.client.app.update(app=test_app)
-        request = util.QSAPIRequest(
-            method='PUT',
-            url=f'/qrs/app/{test_app.id}',
-            params={'privileges': None},
-            data=json.dumps(asdict(test_app))
-        )
-        assert request in self.client.app.requests
-
-    def test_delete(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        self.client.app.delete(app=test_app)
-        request = util.QSAPIRequest(
-            method='DELETE',
-            url=f'/qrs/app/{test_app.id}'
-        )
-        assert request in self.client.app.requests
-
-    def test_copy(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        self.client.app.copy(app=test_app, name=test_app.name)
-        request = util.QSAPIRequest(
-            method='POST',
-            url=f'/qrs/app/{test_app.id}/copy',
-            params={
-                'name': test_app.name,
-                'includecustomproperties': False
-            },
-            data=None
-        )
-        assert request in self.client.app.requests
-
-    def test_replace(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        app_to_replace = self.client.app.get_fake_app(id='app_2')
-        self.client.app.replace(app=test_app, app_to_replace=app_to_replace)
-        request = util.QSAPIRequest(
-            method='PUT',
-            url=f'/qrs/app/{test_app.id}/replace',
-            params={'app': app_to_replace.id}
-        )
-        assert request in self.client.app.requests
-
-    def test_reload(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        self.client.app.reload(app=test_app)
-        request = util.QSAPIRequest(
-            method='POST',
-            url=f'/qrs/app/{test_app.id}/reload'
-        )
-        assert request in self.client.app.requests
-
-    def test_publish(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        test_stream = stream.Stream(id='stream_1', name='My Stream')
-        self.client.app.publish(app=test_app, stream=test_stream)
-        request = util.QSAPIRequest(
-            method='PUT',
-            url=f'/qrs/app/{test_app.id}/publish',
-            params={
-                'stream': test_stream.id,
-                'name': test_app.name
-            },
-            data=None
-        )
-        assert request in self.client.app.requests
-
-    def test_unpublish(self):
-        pass
-
-    def test_get_export_token(self):
-        pass
-
-    def test_create_export(self):
-        test_app = self.client.app.get_fake_app(id='app_1')
-        self.client.app.create_export(app=test_app)
-        for request in self.client.app.requests:
-            if request.method == 'POST':
-                url = request.url
-                assert ['qrs', 'app', test_app.id, 'export'] == url.split('/')[1:5]
-
-    def test_delete_export(self):
-        pass
-
-    def test_download_file(self):
-        app_export = app.AppExport(schema_path='',
-                                   export_token='',
-                                   app_id='app_1',
-                                   download_path='path/to/my/download',
-                                   is_cancelled=False)
-        self.client.app.download_file(app_export=app_export)
-        request = util.QSAPIRequest(
-            method='GET',
-            url=f'/qrs/app/{app_export.download_path}'
-        )
-        assert request in self.client.app.requests
+@pytest.fixture
+def client(client_template: 'Client') -> 'Client':
+    client_template.app.requests.clear()
+    return client_template
+
+
+@pytest.mark.parametrize('verb, kwargs, expected', app_requests, ids=[verb for verb, _, _ in app_requests])
+def test_request(client, verb, kwargs, expected):
+    getattr(client.app, verb)(**kwargs)
+    assert expected in client.app.requests
+
+
+@pytest.mark.parametrize('app_name, stream_name, expected', [
+    ('My App', 'My Stream', app.AppCondensedSchema().load(app_1_json)),
+    ('Not My App', 'My Stream', app.AppCondensedSchema().load(app_2_json)),
+    ('My App', 'Not My Stream', None),
+], ids=['app_1', 'app_2', 'missing'])
+def test_get_by_name_and_stream(client, app_name, stream_name, expected):
+    assert expected == client.app.get_by_name_and_stream(app_name=app_name, stream_name=stream_name)
+
+
+def test_iter_query(client):
+    apps = client.app.query(filter_by="owner.userId eq 'me'", full_attribution=True)
+    assert 2 == len(apps) and 'me' == apps[0].owner.user_name
+    assert apps == list(client.app.iter_query(filter_by="owner.userId eq 'me'", full_attribution=True))
+
+
+def test_iter_query_failure(client):
+    assert client.app.iter_query(filter_by='find my app', full_attribution=True) is None
+    assert util.QSAPIRequest(
+        method='GET',
+        url='/qrs/app/full',
+        params={'filter': 'find my app', 'orderby': None, 'privileges': None}
+    ) in client.app.requests
+
+
+def test_create_export(client):
+    test_app = client.app.get_fake_app(id='app_1')
+    client.app.create_export(app=test_app)
+    assert 1 == len(client.app.requests.get_requests(method='GET', url=f'/qrs/app/{test_app.id}/export'))
+    exports = [export_url.fullmatch(r.url) for r in client.app.requests if r.method == 'POST']
+    assert exports
+    for export in exports:
+        assert export and test_app.id == export.group('app_id')
+
+
+def test_download_file_content(client):
+    app_file = io.BytesIO()
+    for chunk in client.app.download_file(app_export=app_export):
+        app_file.write(chunk)
+    assert app_export_content == app_file.getvalue()
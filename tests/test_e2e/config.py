@@ -1,69 +1,122 @@
 from typing import List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 from tests.conftest import SSLClient, NTLMClient, user, stream, app
 from tests.test_e2e import auth
 
-qs_ssl = SSLClient(host=auth.HOST,
-                   certificate=auth.CERT)
-qs_ssl_restricted = SSLClient(host=auth.HOST,
-                              certificate=auth.CERT,
-                              user=auth.SAMPLE_USER_NAME,
-                              directory=auth.SAMPLE_USER_DIRECTORY)
-qs_ntlm = NTLMClient(host=auth.HOST,
-                     domain=auth.SAMPLE_USER_DIRECTORY,
-                     username=auth.SAMPLE_USER_NAME,
-                     password=auth.SAMPLE_PASSWORD)
-qs_sspi = NTLMClient(host=auth.HOST)
 
+@lru_cache(maxsize=None)
+def qs_ssl() -> 'SSLClient':
+    return SSLClient(host=auth.HOST,
+                     certificate=auth.CERT)
 
-def create_test_user() -> 'user.User':
-    user_stub = user.User(user_name=auth.TEST_USER_NAME,
-                          user_directory=auth.TEST_USER_DIRECTORY)
-    test_user = qs_ssl.user.create(user_stub)
-    verify_owner_was_created = qs_ssl.user.get(id=test_user.id)
-    assert verify_owner_was_created
-    return verify_owner_was_created
+
+@lru_cache(maxsize=None)
+def qs_ssl_restricted() -> 'SSLClient':
+    return SSLClient(host=auth.HOST,
+                     certificate=auth.CERT,
+                     user=auth.SAMPLE_USER_NAME,
+                     directory=auth.SAMPLE_USER_DIRECTORY)
+
+
+@lru_cache(maxsize=None)
+def qs_ntlm() -> 'NTLMClient':
+    return NTLMClient(host=auth.HOST,
+                      domain=auth.SAMPLE_USER_DIRECTORY,
+                      username=auth.SAMPLE_USER_NAME,
+                      password=auth.SAMPLE_PASSWORD)
+
+
+@lru_cache(maxsize=None)
+def qs_sspi() -> 'NTLMClient':
+    return NTLMClient(host=auth.HOST)
+
+
+def worker_name(name: str) -> str:
+    """
+    Suffixes the name of a test entity with the pytest-xdist worker id, if any, so that tests running in parallel
+    workers don't collide on the server
+    """
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    return f'{name}_{worker_id}' if worker_id else name
+
+
+def create_test_user(user_name: str = auth.TEST_USER_NAME) -> 'user.User':
+    user_stub = user.User(user_name=worker_name(user_name),
+                          user_directory=worker_name(auth.TEST_USER_DIRECTORY))
+    test_user = qs_ssl().user.create(user_stub)
+    assert test_user, 'the test user could not be created'
+    return test_user
 
 
 def delete_test_user(test_user: 'user.UserCondensed'):
-    qs_ssl.user.delete(user=test_user)
-    verify_owner_was_deleted = qs_ssl.user.get(id=test_user.id)
-    assert verify_owner_was_deleted is None
+    qs_ssl().user.delete(user=test_user)
 
 
-def create_test_stream(test_owner: 'user.User') -> 'stream.Stream':
-    stream_stub = stream.Stream(name='pytest', owner=test_owner)
-    test_stream = qs_ssl.stream.create(stream=stream_stub)
-    verify_stream_was_created = qs_ssl.stream.get(id=test_stream.id)
-    assert verify_stream_was_created
-    return verify_stream_was_created
+def create_test_stream(test_owner: 'user.User', stream_name: str = 'pytest') -> 'stream.Stream':
+    stream_stub = stream.Stream(name=worker_name(stream_name), owner=test_owner)
+    test_stream = qs_ssl().stream.create(stream=stream_stub)
+    assert test_stream, 'the test stream could not be created'
+    return test_stream
 
 
 def delete_test_stream(test_stream: 'stream.StreamCondensed'):
-    qs_ssl.stream.delete(stream=test_stream)
-    verify_stream_was_deleted = qs_ssl.stream.get(id=test_stream.id)
-    assert verify_stream_was_deleted is None
+    qs_ssl().stream.delete(stream=test_stream)
+
+
+def create_test_app(test_owner: 'user.User', source_app_id: str, app_name: str) -> 'app.App':
+    source_app = qs_ssl().app.get(id=source_app_id)
+    copied_app = qs_ssl().app.copy(app=source_app, name=app_name)
+    copied_app.owner = test_owner
+    return qs_ssl().app.update(app=copied_app)
 
 
 def create_test_apps(test_owner: 'user.User') -> 'List[app.App]':
-    test_apps = []
-    for app_name, app_id in auth.TEST_APPS.items():
-        source_app = qs_ssl.app.get(id=app_id)
-        copied_app = qs_ssl.app.copy(app=source_app, name=app_name)
-        copied_app.owner = test_owner
-        target_app = qs_ssl.app.update(app=copied_app)
-        test_apps.append(target_app)
-    return test_apps
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(create_test_app, test_owner=test_owner, source_app_id=app_id,
+                                   app_name=worker_name(app_name))
+                   for app_name, app_id in auth.TEST_APPS.items()]
+        return [future.result() for future in futures]
 
 
 def delete_test_apps(test_stream: 'stream.StreamCondensed', test_owner: 'user.UserCondensed'):
-    test_apps_by_stream = qs_ssl.app.query(filter_by=f"stream.name eq '{test_stream.name}")
-    test_apps_by_owner = qs_ssl.app.query(filter_by=f"owner.userId eq '{test_owner.user_name}' and "
-                                                    f"owner.userDirectory eq '{test_owner.user_directory.upper()}'")
-    if isinstance(test_apps_by_stream, list):
-        test_apps = test_apps_by_stream.append(test_apps_by_owner)
-    else:
-        test_apps = test_apps_by_owner
-    if test_apps:
-        for test_app in test_apps:
-            qs_ssl.app.delete(app=test_app)
+    test_apps = qs_ssl().app.query(filter_by=f"stream.name eq '{test_stream.name}' or "
+                                             f"(owner.userId eq '{test_owner.user_name}' and "
+                                             f"owner.userDirectory eq '{test_owner.user_directory.upper()}')")
+    assert test_apps is not None, 'the query for test apps to clean up failed, test apps may be left on the server'
+    qs_ssl().app.delete_many(apps=test_apps)
+
+
+def _delete_test_entities(user_directory_filter: str):
+    """
+    Deletes the apps, streams and users that belong to the test user directories matched by user_directory_filter
+    (e.g. "eq 'PYTEST'"), failing loudly if any of the lookups fails so that nothing is silently left on the server
+    """
+    owned_by_test_users = f"owner.userDirectory {user_directory_filter}"
+    test_apps = qs_ssl().app.query(filter_by=owned_by_test_users)
+    assert test_apps is not None, 'the query for test apps to clean up failed, test apps may be left on the server'
+    qs_ssl().app.delete_many(apps=test_apps)
+    test_streams = qs_ssl().stream.query(filter_by=owned_by_test_users)
+    assert test_streams is not None, \
+        'the query for test streams to clean up failed, test streams may be left on the server'
+    qs_ssl().stream.delete_many(streams=test_streams)
+    test_users = qs_ssl().user.query(filter_by=f"userDirectory {user_directory_filter}")
+    assert test_users is not None, 'the query for test users to clean up failed, test users may be left on the server'
+    qs_ssl().user.delete_many(users=test_users)
+
+
+def delete_orphaned_test_entities():
+    """
+    Deletes the apps, streams and users that earlier runs left on the server when they didn't get to tear down. This
+    sweeps every test user directory, whichever worker created it, so it must run before any worker starts.
+    """
+    _delete_test_entities(user_directory_filter=f"sw '{auth.TEST_USER_DIRECTORY.upper()}'")
+
+
+def delete_worker_test_entities():
+    """
+    Deletes whatever this worker's test user directory still owns on the server, leaving parallel workers alone
+    """
+    _delete_test_entities(user_directory_filter=f"eq '{worker_name(auth.TEST_USER_DIRECTORY).upper()}'")
@@ -0,0 +1,99 @@
+import pytest
+
+from tests.test_e2e import auth, config
+
+# the end to end tests run against a live Qlik Sense server, skip collecting them until one is configured in auth.py
+if not auth.HOST:
+    collect_ignore_glob = ['test_*.py']
+
+
+@pytest.fixture(scope='session')
+def qs():
+    client = config.qs_ssl()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def qs_ssl_restricted():
+    client = config.qs_ssl_restricted()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def qs_ntlm():
+    client = config.qs_ntlm()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def qs_sspi():
+    client = config.qs_sspi()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def leftover_test_entities(qs):
+    """
+    Clears out anything this session failed to clean up once it ends. Entities left behind by earlier, crashed runs
+    are swept once before the session starts, see pytest_sessionstart() in tests/conftest.py.
+    """
+    yield
+    config.delete_worker_test_entities()
+
+
+@pytest.fixture(scope='session')
+def test_owner():
+    test_owner = config.create_test_user()
+    yield test_owner
+    config.delete_test_user(test_user=test_owner)
+
+
+@pytest.fixture(scope='session')
+def test_stream(test_owner):
+    test_stream = config.create_test_stream(test_owner=test_owner)
+    yield test_stream
+    config.delete_test_stream(test_stream=test_stream)
+
+
+@pytest.fixture
+def fresh_user():
+    """
+    A user for tests that change the user on the server, so that the shared test owner is left as it was created
+    """
+    fresh_user = config.create_test_user(user_name=f'{auth.TEST_USER_NAME}_fresh')
+    yield fresh_user
+    config.delete_test_user(test_user=fresh_user)
+
+
+@pytest.fixture
+def fresh_stream(test_owner):
+    """
+    A stream for tests that change the stream on the server, so that the shared test stream is left as it was created
+    """
+    fresh_stream = config.create_test_stream(test_owner=test_owner, stream_name='pytest_fresh')
+    yield fresh_stream
+    config.delete_test_stream(test_stream=fresh_stream)
+
+
+@pytest.fixture(scope='class')
+def test_apps(test_owner, test_stream):
+    test_apps = config.create_test_apps(test_owner=test_owner)
+    yield test_apps
+    config.delete_test_apps(test_stream=test_stream, test_owner=test_owner)
+
+
+@pytest.fixture
+def fresh_app(qs, test_owner):
+    """
+    A copy of a test app for tests that change the app on the server (rename, publish, etc.), so that the class-wide
+    test apps are left as they were created
+    """
+    app_name, app_id = next(iter(auth.TEST_APPS.items()))
+    fresh_app = config.create_test_app(test_owner=test_owner, source_app_id=app_id,
+                                       app_name=config.worker_name(f'{app_name}_fresh'))
+    yield fresh_app
+    qs.app.delete(app=fresh_app)
@@ -1,30 +1,34 @@
-from tests.test_e2e import config
+import pytest
 
-qs_ssl = config.qs_ssl
-qs_ssl_restricted = config.qs_ssl_restricted
-qs_ntlm = config.qs_ntlm
-qs_sspi = config.qs_sspi
+pytestmark = pytest.mark.live
+
+
+@pytest.fixture(scope='module')
+def ssl_count(qs):
+    return qs.stream.query_count()
+
+
+@pytest.fixture(scope='module')
+def ssl_restricted_count(qs_ssl_restricted):
+    return qs_ssl_restricted.stream.query_count()
+
+
+@pytest.fixture(scope='module')
+def ntlm_count(qs_ntlm):
+    return qs_ntlm.stream.query_count()
+
+
+@pytest.fixture(scope='module')
+def sspi_count(qs_sspi):
+    return qs_sspi.stream.query_count()
 
 
 class TestClient:
 
-    def test_ssl_restricted(self):
-        ssl_count = qs_ssl.stream.query_count()
-        ssl_restricted_count = qs_ssl_restricted.stream.query_count()
-        assert 0 < ssl_restricted_count <= ssl_count
-
-    def test_ntlm(self):
-        ssl_count = qs_ssl.stream.query_count()
-        ntlm_count = qs_ntlm.stream.query_count()
-        assert 0 < ntlm_count <= ssl_count
-
-    def test_sspi(self):
-        ssl_count = qs_ssl.stream.query_count()
-        sspi_count = qs_sspi.stream.query_count()
-        assert 0 < sspi_count <= ssl_count
-
-    def test_equivalent_counts(self):
-        ssl_restricted_count = qs_ssl_restricted.stream.query_count()
-        ntlm_count = qs_ntlm.stream.query_count()
-        sspi_count = qs_sspi.stream.query_count()
+    @pytest.mark.parametrize('sample_user_count', ['ssl_restricted_count', 'ntlm_count', 'sspi_count'],
+                             ids=['ssl_restricted', 'ntlm', 'sspi'])
+    def test_sample_user_count(self, ssl_count, sample_user_count, request):
+        assert 0 < request.getfixturevalue(sample_user_count) <= ssl_count
+
+    def test_equivalent_counts(self, ssl_restricted_count, ntlm_count, sspi_count):
         assert ssl_restricted_count == ntlm_count == sspi_count
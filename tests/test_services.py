@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .conftest import services, app, stream, user, util
+from .fakes import FakeClient, FakeAppService, FakeStreamService, FakeUserService
+
+
+@pytest.mark.parametrize('max_concurrent_requests', [16, 1], ids=['concurrent', 'sequential'])
+@pytest.mark.parametrize('fake_service, entity, entities_arg', [
+    (FakeAppService, app.AppCondensed, 'apps'),
+    (FakeStreamService, stream.StreamCondensed, 'streams'),
+    (FakeUserService, user.UserCondensed, 'users'),
+], ids=['app', 'stream', 'user'])
+def test_delete_many(fake_service, entity, entities_arg, max_concurrent_requests, monkeypatch):
+    executors = []
+
+    class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            executors.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(FakeClient, 'max_concurrent_requests', max_concurrent_requests)
+    monkeypatch.setattr(services.base, 'ThreadPoolExecutor', RecordingThreadPoolExecutor)
+    service = fake_service()
+    entities = [entity(id=f'entity_{i}') for i in range(2 * max_concurrent_requests)]
+    service.delete_many(**{entities_arg: entities})
+    assert [max_concurrent_requests] == executors
+    assert len(entities) == len(service.requests)
+    for each_entity in entities:
+        assert util.QSAPIRequest(method='DELETE', url=f'{service.url}/{each_entity.id}') in service.requests